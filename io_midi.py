@@ -22,16 +22,26 @@ import math
 from pathlib import Path
 from typing import Dict, Any, List
 
+import numpy as np
+
+from sequencer import events_to_array
+
+
+# Single‑byte encodings cover the common case of short deltas and lengths
+_VARLEN_SMALL = [bytes([v]) for v in range(0x80)]
+
 
 def _varlen(value: int) -> bytes:
     """Encode an integer as a variable‑length quantity (7 bits per byte)."""
-    buffer = value & 0x7F
-    result = bytearray([buffer])
+    if 0 <= value < 0x80:
+        return _VARLEN_SMALL[value]
+    # Emit least significant group first, then reverse into MIDI order
+    result = bytearray([value & 0x7F])
     value >>= 7
     while value:
-        buffer = (value & 0x7F) | 0x80
-        result.insert(0, buffer)
+        result.append((value & 0x7F) | 0x80)
         value >>= 7
+    result.reverse()
     return bytes(result)
 
 
@@ -59,44 +69,38 @@ def export_midi(plan: Dict[str, Any], path: Path) -> None:
     numerator = int(time_signature[0])
     denominator = int(time_signature[1])
     ticks_per_beat = 480  # PPQN (pulses per quarter note)
-    events = plan.get("events", [])
-    # Sort events by time for correct ordering
-    events_sorted = sorted(events, key=lambda e: e["time"])
-    # Convert time in seconds to ticks
+    events = events_to_array(plan.get("events", []))
+    # Sort events by time for correct ordering (stable, like `sorted`)
+    events = events[np.argsort(events["time"], kind='stable')]
+    # Convert times and durations in seconds to ticks in one pass each
     seconds_per_beat = 60.0 / bpm
-    def sec_to_ticks(sec: float) -> int:
-        return int(sec / seconds_per_beat * ticks_per_beat)
-    # Build track data
-    track_data = bytearray()
+    start_ticks = (events["time"] / seconds_per_beat * ticks_per_beat).astype(np.int64).tolist()
+    duration_ticks = (events["duration"] / seconds_per_beat * ticks_per_beat).astype(np.int64).tolist()
+    notes = events["note"].tolist()
+    velocities = (events["velocity"] * 127).astype(np.int64).tolist()
+    # Build track data as a list of chunks joined once at the end
+    chunks: List[bytes] = []
     # Tempo meta event (microseconds per quarter note)
     mpqn = int(60_000_000 / bpm)
-    track_data += _write_meta_event(0, 0x51, struct.pack('>I', mpqn)[1:])
+    chunks.append(_write_meta_event(0, 0x51, struct.pack('>I', mpqn)[1:]))
     # Time signature meta event
-    track_data += _write_meta_event(0, 0x58, bytes([numerator, int(math.log2(denominator)), 24, 8]))
+    chunks.append(_write_meta_event(0, 0x58, bytes([numerator, int(math.log2(denominator)), 24, 8])))
     # Note events
     last_tick = 0
-    for event in events_sorted:
-        start_tick = sec_to_ticks(event["time"])
+    for start_tick, duration_tick, note, velocity in zip(start_ticks, duration_ticks, notes, velocities):
         delta = start_tick - last_tick
-        note = event.get("note", 60)
-        velocity = int(event.get("velocity", 1.0) * 127)
-        duration_tick = sec_to_ticks(event.get("duration", 1.0))
         # Note on
-        track_data += _note_on(delta, 0, note, velocity)
+        chunks.append(_note_on(delta, 0, note, velocity))
         # Note off
-        track_data += _note_off(duration_tick, 0, note, 0)
+        chunks.append(_note_off(duration_tick, 0, note, 0))
         last_tick = start_tick + duration_tick
     # End of track meta event
-    track_data += _write_meta_event(0, 0x2F, b"")
+    chunks.append(_write_meta_event(0, 0x2F, b""))
+    track_data = b"".join(chunks)
     # Build MIDI file structure
     with open(path, 'wb') as f:
-        # Header chunk
-        f.write(b"MThd")
-        f.write(struct.pack('>I', 6))  # header length
-        f.write(struct.pack('>H', 1))  # format type 1
-        f.write(struct.pack('>H', 1))  # one track
-        f.write(struct.pack('>H', ticks_per_beat))  # division
+        # Header chunk: length 6, format type 1, one track, division
+        f.write(struct.pack('>4sIHHH', b"MThd", 6, 1, 1, ticks_per_beat))
         # Track chunk
-        f.write(b"MTrk")
-        f.write(struct.pack('>I', len(track_data)))
+        f.write(struct.pack('>4sI', b"MTrk", len(track_data)))
         f.write(track_data)
\ No newline at end of file
@@ -35,22 +35,21 @@ def write_report(plan: Dict[str, Any], output_path: Path) -> None:
     length_bars = plan.get("length_bars", "n/a")
     metrics = plan.get("metrics", {})
     completions = plan.get("completions", {})
-    # Compose Markdown
-    lines = []
-    lines.append(f"# DawlessGPTv6 Session Report\n")
-    lines.append(f"**Seed:** {seed}  ")
-    lines.append(f"**Quality:** {quality}  ")
-    lines.append(f"**Length (bars):** {length_bars}\n")
-    lines.append("## Metrics\n")
-    for k, v in metrics.items():
-        lines.append(f"- **{k}:** {v}")
-    lines.append("\n## Auto‑completed Fields\n")
+    # Compose Markdown in one list and write it with a single call
     if completions:
-        for k, v in completions.items():
-            lines.append(f"- **{k}:** {v} [HYPOTHÈSE] (Confiance: Élevé)")
+        completion_lines = [f"- **{k}:** {v} [HYPOTHÈSE] (Confiance: Élevé)" for k, v in completions.items()]
     else:
-        lines.append("No fields were auto‑completed.")
-    lines.append("\n## Notes\n")
-    lines.append("Ce rapport est généré automatiquement par DawlessGPTv6. Les valeurs auto‑complétées sont notées comme des hypothèses.\n")
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines))
\ No newline at end of file
+        completion_lines = ["No fields were auto‑completed."]
+    lines = [
+        "# DawlessGPTv6 Session Report\n",
+        f"**Seed:** {seed}  ",
+        f"**Quality:** {quality}  ",
+        f"**Length (bars):** {length_bars}\n",
+        "## Metrics\n",
+        *(f"- **{k}:** {v}" for k, v in metrics.items()),
+        "\n## Auto‑completed Fields\n",
+        *completion_lines,
+        "\n## Notes\n",
+        "Ce rapport est généré automatiquement par DawlessGPTv6. Les valeurs auto‑complétées sont notées comme des hypothèses.\n",
+    ]
+    Path(output_path).write_text("\n".join(lines), encoding="utf-8")
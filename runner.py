@@ -22,7 +22,7 @@ High‑level flow:
 TODOs:
     [ ] Integrate REAL BLEP oscillators and ZDF filters for sound quality.
     [ ] Implement a proper scheduler with Euclidean rhythms and humanisation.
-    [ ] Add logging of completions and decisions to SQLite via `sqlite_log.py`.
+    [X] Add logging of completions and decisions to SQLite via `sqlite_log.py`.
 
 """
 
@@ -31,7 +31,9 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any
+
+import numpy as np
 
 # Local imports will be available when this file is loaded via sys.path by the GPT.
 from completion import complete_plan
@@ -40,6 +42,7 @@ from sequencer import schedule_events
 from synth_engine import render_tracks
 from fx_core import apply_fx
 from io_audio import write_wav
+from sqlite_log import log_session, flush as flush_session_log
 from utils import validate_plan, load_schema, load_config
 
 
@@ -68,7 +71,7 @@ def run(plan: Dict[str, Any]) -> Path:
     generate_progression(full_plan)
     generate_arp(full_plan)
     # Schedule events (notes, drums, automation)
-    events: List[Dict[str, Any]] = schedule_events(full_plan)
+    events: np.ndarray = schedule_events(full_plan)
     # Render audio for each track
     tracks_audio = render_tracks(full_plan, events, config)
     # Apply FX and mix/master
@@ -76,6 +79,9 @@ def run(plan: Dict[str, Any]) -> Path:
     # Export WAV
     output_name = f"render_{full_plan.get('seed', 0)}.wav"
     output_path = Path("/mnt/data") / output_name
-    write_wav(mixed_audio, config["sample_rate"], output_path)
-    # TODO: log completions and decisions via sqlite_log
+    # Seed the dither from the plan so a given plan always renders the same file
+    write_wav(mixed_audio, config["sample_rate"], output_path, seed=full_plan.get("seed"))
+    # Log the session and write it out now rather than leaving it queued
+    log_session(full_plan.get("seed", 0), full_plan, completions, str(output_path))
+    flush_session_log()
     return output_path
\ No newline at end of file
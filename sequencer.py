@@ -15,32 +15,77 @@ TODOs:
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 
+import numpy as np
 
-def schedule_events(plan: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Create a list of scheduled events from the completed plan.
+# Packed record layout for scheduled events.  Times and durations are in
+# seconds; they stay float64 so that tick and sample conversions round
+# exactly as they would from Python floats.
+EVENT_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("note", np.int16),
+    ("velocity", np.float32),
+    ("duration", np.float64),
+])
 
-    Each event is represented as a dictionary with at least a `time`
-    key (in seconds) and may include `note`, `velocity`, `duration`
-    and other parameters.  This simple implementation only expands
-    drum patterns into events; note events for melodic tracks should be
-    generated in future PRs.
+
+# Drum lanes: (pattern key, MIDI note, velocity, duration in beats)
+_DRUM_LANES = (
+    ("kick", 36, 1.0, 1.0),  # C1
+    ("snare", 38, 0.8, 1.0),  # D1
+    ("hats", 42, 0.6, 0.5),  # F#1
+)
+
+
+def events_to_array(events: Iterable[Dict[str, Any]] | np.ndarray) -> np.ndarray:
+    """Convert event dictionaries (e.g. from a JSON plan) to an `EVENT_DTYPE` array.
+
+    Missing `note`, `velocity` and `duration` keys default to 60, 1.0 and
+    1.0 respectively.  Arrays that already use `EVENT_DTYPE` are returned
+    unchanged.
+    """
+    if isinstance(events, np.ndarray) and events.dtype == EVENT_DTYPE:
+        return events
+    # Stream records straight into the array without an intermediate list
+    records = (
+        (e["time"], e.get("note", 60), e.get("velocity", 1.0), e.get("duration", 1.0))
+        for e in events
+    )
+    count = len(events) if hasattr(events, "__len__") else -1
+    return np.fromiter(records, dtype=EVENT_DTYPE, count=count)
+
+
+def schedule_events(plan: Dict[str, Any]) -> np.ndarray:
+    """Create an array of scheduled events from the completed plan.
+
+    Events are returned as a structured array of `EVENT_DTYPE` records
+    with `time`, `note`, `velocity` and `duration` fields, so consumers can
+    operate on whole columns (e.g. `events["time"]`).  This simple
+    implementation only expands drum patterns into events; note events for
+    melodic tracks should be generated in future PRs.
     """
     bpm = plan["bpm"]
     seconds_per_beat = 60.0 / bpm
-    events: List[Dict[str, Any]] = []
+    lanes: List[np.ndarray] = []
     # Schedule drums based on 16th‑note patterns
     drums = plan.get("drums", {})
     length_bars = plan.get("length_bars", 1)
     total_steps = length_bars * 16
-    for i in range(total_steps):
-        time = (i / 4.0) * seconds_per_beat  # 4 sixteenths per beat
-        if drums.get("kick") and i < len(drums["kick"]) and drums["kick"][i] == 1:
-            events.append({"time": time, "note": 36, "velocity": 1.0, "duration": seconds_per_beat})  # C1
-        if drums.get("snare") and i < len(drums["snare"]) and drums["snare"][i] == 1:
-            events.append({"time": time, "note": 38, "velocity": 0.8, "duration": seconds_per_beat})  # D1
-        if drums.get("hats") and i < len(drums["hats"]) and drums["hats"][i] == 1:
-            events.append({"time": time, "note": 42, "velocity": 0.6, "duration": seconds_per_beat / 2})  # F#1
+    for name, note, velocity, beats in _DRUM_LANES:
+        pattern = np.asarray(drums.get(name) or [])
+        steps = np.flatnonzero(pattern[:total_steps] == 1)
+        if steps.size == 0:
+            continue
+        lane = np.empty(steps.size, dtype=EVENT_DTYPE)
+        lane["time"] = (steps / 4.0) * seconds_per_beat  # 4 sixteenths per beat
+        lane["note"] = note
+        lane["velocity"] = velocity
+        lane["duration"] = seconds_per_beat * beats
+        lanes.append(lane)
     # TODO: schedule melodic events based on progression and arp rules
-    return events
\ No newline at end of file
+    if not lanes:
+        return np.empty(0, dtype=EVENT_DTYPE)
+    events = np.concatenate(lanes)
+    # Interleave lanes back into time order; ties keep kick/snare/hats order
+    return events[np.argsort(events["time"], kind="stable")]
@@ -3,24 +3,55 @@
 This module records session information, auto‑completions, decisions and
 artefact metadata to a SQLite database.  Logging helps trace the evolution
 of a session and provides auditability.  The default database file is
-`/mnt/data/dawlessgptv6.db`.  Basic insertion is implemented; more
-comprehensive tables and indices can be added later.
+`/mnt/data/dawlessgptv6.db`; set the `DAWLESS_DB` environment variable to
+use another location.  Basic insertion is implemented; more
+comprehensive tables can be added later.  Session records are
+buffered in memory and written in batches, one transaction per batch; call
+`flush()` to force pending records to disk.  Plans and completions may be
+passed as dicts; they are encoded to JSON when they are logged.
 
 TODOs:
     [X] Implement a simple table creation and insertion logic.
-    [ ] Add indices and foreign keys for performance and relational integrity.
+    [X] Add indices and foreign keys for performance and relational integrity.
     [ ] Expose query functions for summarising sessions and completions.
 
 """
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
 import sqlite3
+import threading
+import warnings
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, List, Tuple
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # JSON encoding falls back to the standard library
 
-DB_PATH = Path("/mnt/data/dawlessgptv6.db")
+
+DB_PATH = Path(os.environ.get("DAWLESS_DB", "/mnt/data/dawlessgptv6.db"))
+
+# Bytes of the database file SQLite may memory‑map for reads (256 MiB)
+MMAP_SIZE = 1 << 28
+
+_INSERT_SESSION = "INSERT INTO sessions (seed, plan, completions, wav_path) VALUES (?, ?, ?, ?)"
+
+# (seed, plan, completions, wav_path) as passed in; plan and completions are
+# JSON strings or JSON‑serialisable dicts
+SessionRecord = Tuple[int, Any, Any, str]
+
+# Number of buffered `log_session` records that triggers a write
+FLUSH_EVERY = 64
+
+# Connection shared by all calls in this process; opened lazily
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+_pending: List[Tuple[int, str, str, str]] = []
 
 
 def _ensure_tables(conn: sqlite3.Connection) -> None:
@@ -29,29 +60,141 @@ def _ensure_tables(conn: sqlite3.Connection) -> None:
         "id INTEGER PRIMARY KEY AUTOINCREMENT, seed INTEGER, plan TEXT, completions TEXT, wav_path TEXT, created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
         ")"
     )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_seed ON sessions(seed)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at DESC)")
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared connection, opening and configuring it on first use.
+
+    The database runs in WAL mode with `synchronous=NORMAL`, so a commit
+    appends to the log instead of forcing an fsync of the main file, and
+    readers are not blocked by writers.  Reads go through a memory map of up
+    to `MMAP_SIZE` bytes instead of copying pages into SQLite's cache.
+    """
+    global _conn
+    if _conn is None:
+        conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+        # page_size only takes effect on a new database, so set it before WAL
+        conn.execute("PRAGMA page_size=8192")
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-8000")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        _ensure_tables(conn)
+        _conn = conn
+    return _conn
+
+
+def _to_json(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _encode_row(seed: int, plan: Any, completions: Any, wav_path: Any) -> Tuple[int, str, str, str]:
+    # Encoding up front snapshots the dicts and raises on unencodable values
+    # in the caller, before the record reaches the queue or a transaction
+    return seed, _to_json(plan), _to_json(completions), str(wav_path)
+
+
+def _insert_many(rows: Iterable[Tuple[int, str, str, str]]) -> None:
+    # Caller holds `_lock`.  One explicit transaction for the whole batch; on
+    # any failure (including COMMIT) roll back so the connection stays usable.
+    conn = _get_conn()
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(_INSERT_SESSION, rows)
+        conn.execute("COMMIT")
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
 
+def _flush_pending() -> None:
+    # Caller holds `_lock`.  If the write fails the batch stays pending.
+    if _pending:
+        _insert_many(_pending)
+        _pending.clear()
 
-def log_session(seed: int, plan_json: str, completions_json: str, wav_path: str) -> None:
-    """Insert a session record into the database.
+
+def flush() -> None:
+    """Write any buffered session records to the database."""
+    with _lock:
+        _flush_pending()
+
+
+def close() -> None:
+    """Flush buffered records and close the shared connection.
+
+    Registered to run at interpreter exit.
+    """
+    global _conn
+    with _lock:
+        try:
+            _flush_pending()
+        finally:
+            if _conn is not None:
+                _conn.close()
+                _conn = None
+
+
+atexit.register(close)
+
+
+def log_sessions(rows: Iterable[SessionRecord]) -> None:
+    """Insert many session records in a single transaction.
+
+    Parameters
+    ----------
+    rows : iterable of tuple
+        `(seed, plan, completions, wav_path)` records, as taken by
+        `log_session`.
+    """
+    encoded = [_encode_row(*row) for row in rows]
+    with _lock:
+        _insert_many(encoded)
+
+
+def log_session(
+    seed: int,
+    plan_json: str | Dict[str, Any],
+    completions_json: str | Dict[str, Any],
+    wav_path: str,
+) -> None:
+    """Queue a session record for insertion into the database.
+
+    Records are written in batches of `FLUSH_EVERY`, by `flush()`, or at
+    interpreter exit.  A failed batch write is reported as a
+    `RuntimeWarning` rather than raised here, since the batch holds other
+    calls' records; the batch stays queued and is retried by `flush()` or
+    once another `FLUSH_EVERY` records have been queued.  Dicts are encoded
+    to JSON immediately, so later changes to them do not affect the record.
 
     Parameters
     ----------
     seed : int
         Random seed used for this session.
-    plan_json : str
-        JSON string of the completed plan.
-    completions_json : str
-        JSON string describing which fields were auto‑completed.
+    plan_json : str or dict
+        The completed plan, as a JSON string or a dict.
+    completions_json : str or dict
+        Which fields were auto‑completed, as a JSON string or a dict.
     wav_path : str
         Path to the rendered WAV file.
     """
-    conn = sqlite3.connect(DB_PATH)
-    try:
-        _ensure_tables(conn)
-        conn.execute(
-            "INSERT INTO sessions (seed, plan, completions, wav_path) VALUES (?, ?, ?, ?)",
-            (seed, plan_json, completions_json, wav_path)
-        )
-        conn.commit()
-    finally:
-        conn.close()
\ No newline at end of file
+    record = _encode_row(seed, plan_json, completions_json, wav_path)
+    with _lock:
+        _pending.append(record)
+        if len(_pending) % FLUSH_EVERY == 0:
+            try:
+                _flush_pending()
+            except sqlite3.Error as exc:
+                warnings.warn(
+                    f"could not write {len(_pending)} queued session records: {exc}",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
@@ -19,60 +19,89 @@ TODOs:
 from __future__ import annotations
 
 import math
+from collections import OrderedDict
 from typing import Dict, Any, List, Tuple
 
-from dsp_core import sine_wave
+import numpy as np
 
+from dsp_core import add_sine
 
-def midi_to_freq(note: int) -> float:
-    """Convert a MIDI note number to frequency in Hz."""
-    return 440.0 * (2 ** ((note - 69) / 12))
 
+# Maximum number of distinct rendered tones kept per `render_tracks` call
+_TONE_CACHE_SIZE = 512
 
-def render_tracks(plan: Dict[str, Any], events: List[Dict[str, Any]], config: Dict[str, Any]) -> List[List[float]]:
+# Equal‑tempered frequency of every MIDI note (A4 = 69 = 440 Hz)
+_MIDI_FREQ = 440.0 * np.exp2((np.arange(128, dtype=np.float64) - 69) / 12.0)
+
+
+def midi_to_freq(note: int | np.ndarray) -> float | np.ndarray:
+    """Convert a MIDI note number (or an array of them) to frequency in Hz.
+
+    Notes outside the MIDI range 0..127 are clamped to it.
+    """
+    freqs = _MIDI_FREQ[np.clip(note, 0, 127)]
+    return float(freqs) if np.ndim(freqs) == 0 else freqs
+
+
+def render_tracks(plan: Dict[str, Any], events: np.ndarray, config: Dict[str, Any]) -> List[np.ndarray]:
     """Render audio for each track defined in the plan.
 
     Parameters
     ----------
     plan : dict
         Completed plan with tracks and events.
-    events : list of dict
-        Scheduled events produced by the sequencer.
+    events : numpy.ndarray
+        Scheduled `sequencer.EVENT_DTYPE` events produced by the sequencer.
     config : dict
         Configuration rails containing sample rate and other limits.
 
     Returns
     -------
-    list of list of float
-        A list of audio buffers, one per track.  The buffers are of
+    list of numpy.ndarray
+        A list of float32 audio buffers, one per track.  The buffers are of
         identical length and will later be mixed in `fx_core.apply_fx`.
     """
     sample_rate = config["sample_rate"]
     # Determine total length based on the last event
-    total_seconds = 0.0
-    for event in events:
-        end_time = event["time"] + event["duration"]
-        if end_time > total_seconds:
-            total_seconds = end_time
+    end_times = events["time"] + events["duration"]
+    total_seconds = max(float(end_times.max()), 0.0) if end_times.size else 0.0
     num_samples = int(total_seconds * sample_rate) + 1
+    # Per‑event render parameters, computed column‑wise for all events
+    start_samples = (events["time"] * sample_rate).astype(np.int64)
+    duration_samples = (events["duration"] * sample_rate).astype(np.int64)
+    lengths = np.minimum(duration_samples, num_samples - start_samples)
+    voices = list(zip(
+        start_samples.tolist(), lengths.tolist(), events["note"].tolist(),
+        duration_samples.tolist(), events["velocity"].tolist(),
+    ))
+    # Rendered tones keyed by (note, duration in samples); the same drum hit
+    # recurs many times, so each distinct tone is synthesised only once
+    tone_cache: OrderedDict[Tuple[int, int], np.ndarray] = OrderedDict()
 
-    # Prepare a buffer per track
-    track_buffers: List[List[float]] = []
-    for track_name, track_data in plan.get("tracks", {}).items():
-        buffer = [0.0] * num_samples
-        # Render events assigned to this track
-        for event in events:
-            # For now assign all events to the first track by default
-            # TODO: assign events to tracks based on instrument type
-            freq = midi_to_freq(event.get("note", 60))
-            start_sample = int(event["time"] * sample_rate)
-            duration_samples = int(event["duration"] * sample_rate)
-            for i in range(duration_samples):
-                if start_sample + i < num_samples:
-                    t = i / sample_rate
-                    buffer[start_sample + i] += sine_wave(freq, t)
-        # Normalise to avoid clipping before mixing
-        max_amp = max(abs(x) for x in buffer) or 1.0
-        buffer = [x / max_amp for x in buffer]
-        track_buffers.append(buffer)
-    return track_buffers
\ No newline at end of file
+    track_names = list(plan.get("tracks", {}))
+    if not track_names:
+        return []
+    # Every event currently plays on every track, so render the events once
+    # into a master buffer and give each track its own copy of it
+    # TODO: assign events to tracks based on instrument type, rendering each
+    # event straight into its track's buffer (still one pass per event)
+    master = np.zeros(num_samples, dtype=np.float32)
+    for start_sample, n, note, length, velocity in voices:
+        if n <= 0:
+            continue
+        key = (note, length)
+        tone = tone_cache.get(key)
+        if tone is None:
+            tone = np.zeros(length, dtype=np.float32)
+            add_sine(tone, 0, length, midi_to_freq(note), sample_rate)
+            tone_cache[key] = tone
+            if len(tone_cache) > _TONE_CACHE_SIZE:
+                tone_cache.popitem(last=False)
+        else:
+            tone_cache.move_to_end(key)
+        master[start_sample:start_sample + n] += velocity * tone[:n]
+    # Normalise once, before copying, so all tracks share one gain and their
+    # relative levels survive into the mix
+    max_amp = float(max(master.max(), -master.min())) or 1.0
+    master *= np.float32(1.0 / max_amp)
+    return [master] + [master.copy() for _ in track_names[1:]]
@@ -3,13 +3,13 @@
 This module houses helper functions used across the codebase, including
 plan validation against the JSON schema, configuration loading from YAML,
 VarLen encoding for MIDI, bank merging and safe gain calculations.  The
-validation implementation here is naive and should be replaced with a
-proper JSON Schema validator when allowed.  YAML parsing uses the built‑in
+validation uses `jsonschema` when it is installed and otherwise falls back
+to a naive required‑keys check.  YAML parsing uses the built‑in
 `yaml` module if available; otherwise a minimal parser is provided.
 
 TODOs:
     [X] Implement simple schema validation by checking required keys exist.
-    [ ] Use a full JSON schema validator (e.g. `jsonschema`) when permitted.
+    [X] Use a full JSON schema validator (e.g. `jsonschema`) when permitted.
     [ ] Implement bank merging and CC mapping ingestion.
     [ ] Add curve helpers (exponential/logarithmic/S) used in automation.
     [ ] Provide safe gain calculations to avoid clipping when mixing.
@@ -20,80 +20,186 @@ from __future__ import annotations
 
 import json
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, TextIO, Tuple
 
 try:
     import yaml  # type: ignore
 except ImportError:
     yaml = None  # YAML parsing will fall back to a simple parser
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # JSON parsing falls back to the standard library
+
+try:
+    import jsonschema  # type: ignore
+except ImportError:
+    jsonschema = None  # validation falls back to a required‑keys check
+
 
 SCHEMA_PATH = Path(os.environ.get("SCHEMA_PATH", "schema.json"))
 CONFIG_PATH = Path(os.environ.get("CONFIG_PATH", "config.yaml"))
 
 
+# Schema and config are parsed once per process and the same dict is handed
+# to every caller: treat the returned objects as read‑only.
+
+@lru_cache(maxsize=1)
 def load_schema() -> Dict[str, Any]:
-    """Load the JSON schema from disk."""
+    """Load the JSON schema from disk (cached; do not mutate the result)."""
     with open(SCHEMA_PATH, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def _parse_simple_yaml(f: TextIO) -> Dict[str, Any]:
+    """Minimal YAML parser: handle simple key: value pairs and nested dicts."""
+    config: Dict[str, Any] = {}
+    current_dict = config
+    stack: List[Dict[str, Any]] = []
+    indent_levels: List[int] = []
+    for line in f:
+        stripped = line.strip()
+        if not stripped or stripped.startswith('#'):
+            continue
+        indent = len(line) - len(line.lstrip(' '))
+        key, _, value = stripped.partition(':')
+        key = key.strip()
+        value = value.strip()
+        if not value:
+            # Nested dict
+            new_dict: Dict[str, Any] = {}
+            current_dict[key] = new_dict
+            stack.append(current_dict)
+            indent_levels.append(indent)
+            current_dict = new_dict
+        else:
+            # Parse simple types
+            if value.lower() in ['true', 'false']:
+                parsed: Any = value.lower() == 'true'
+            elif value.isdigit():
+                parsed = int(value)
+            else:
+                try:
+                    parsed = float(value)
+                except ValueError:
+                    parsed = value
+            current_dict[key] = parsed
+        # Pop back when indent decreases
+        while indent_levels and indent < indent_levels[-1]:
+            current_dict = stack.pop()
+            indent_levels.pop()
+    return config
+
+
+def _config_json_path() -> Path:
+    return CONFIG_PATH.with_suffix('.json')
+
+
+def _json_sidecar_is_fresh(json_path: Path) -> bool:
+    """True if the JSON sidecar exists and is not older than the YAML config."""
+    try:
+        json_mtime = json_path.stat().st_mtime
+    except OSError:
+        return False
+    try:
+        return json_mtime >= CONFIG_PATH.stat().st_mtime
+    except OSError:
+        return True
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, Any]:
-    """Load the YAML configuration from disk.
+    """Load the configuration from disk (cached; do not mutate the result).
 
-    Falls back to a minimal parser if the `yaml` module is unavailable.
+    A JSON sidecar next to the YAML file (e.g. `config.json`, written by
+    `dump_config_json`) is preferred when it is at least as recent as the
+    YAML, as it is read with a single `json.load`.  Otherwise the YAML is
+    parsed, falling back to a minimal parser if the `yaml` module is
+    unavailable.
     """
+    json_path = _config_json_path()
+    if _json_sidecar_is_fresh(json_path):
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
     with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
         if yaml is not None:
             return yaml.safe_load(f)
-        # Minimal YAML parser: handle simple key: value pairs and nested
-        config: Dict[str, Any] = {}
-        current_dict = config
-        stack: List[Dict[str, Any]] = []
-        indent_levels: List[int] = []
-        for line in f:
-            stripped = line.strip()
-            if not stripped or stripped.startswith('#'):
-                continue
-            indent = len(line) - len(line.lstrip(' '))
-            key, _, value = stripped.partition(':')
-            key = key.strip()
-            value = value.strip()
-            if not value:
-                # Nested dict
-                new_dict: Dict[str, Any] = {}
-                current_dict[key] = new_dict
-                stack.append(current_dict)
-                indent_levels.append(indent)
-                current_dict = new_dict
-            else:
-                # Parse simple types
-                if value.lower() in ['true', 'false']:
-                    parsed: Any = value.lower() == 'true'
-                elif value.isdigit():
-                    parsed = int(value)
-                else:
-                    try:
-                        parsed = float(value)
-                    except ValueError:
-                        parsed = value
-                current_dict[key] = parsed
-            # Pop back when indent decreases
-            while indent_levels and indent < indent_levels[-1]:
-                current_dict = stack.pop()
-                indent_levels.pop()
-        return config
+        return _parse_simple_yaml(f)
+
+
+def dump_config_json(config: Dict[str, Any] | None = None) -> Path:
+    """Write the canonical JSON sidecar of the configuration.
+
+    Parameters
+    ----------
+    config : dict, optional
+        Configuration to write; defaults to the currently loaded config.
+
+    Returns
+    -------
+    Path
+        Location of the written sidecar (`CONFIG_PATH` with a `.json` suffix).
+    """
+    if config is None:
+        config = load_config()
+    json_path = _config_json_path()
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(config, f, indent=2)
+    return json_path
+
+
+def clear_config_cache() -> None:
+    """Forget the cached schema and config so the next load rereads the files."""
+    load_schema.cache_clear()
+    load_config.cache_clear()
+
+
+# Maximum number of compiled validators kept (least recently used dropped)
+_VALIDATOR_CACHE_SIZE = 4
+
+# Compiled validators keyed by schema identity; the schema is kept alongside
+# so its id cannot be reused by another object while the entry exists
+_VALIDATORS: OrderedDict[int, Tuple[Dict[str, Any], Any]] = OrderedDict()
+
+
+def _validator(schema: Dict[str, Any]) -> Any:
+    """Return a compiled `jsonschema` validator for `schema`, building it once."""
+    key = id(schema)
+    entry = _VALIDATORS.get(key)
+    if entry is None or entry[0] is not schema:
+        cls = jsonschema.validators.validator_for(schema)
+        cls.check_schema(schema)
+        entry = (schema, cls(schema))
+        _VALIDATORS[key] = entry
+        if len(_VALIDATORS) > _VALIDATOR_CACHE_SIZE:
+            _VALIDATORS.popitem(last=False)
+    _VALIDATORS.move_to_end(key)
+    return entry[1]
 
 
 def validate_plan(plan: Dict[str, Any], schema: Dict[str, Any]) -> None:
     """Validate a plan against the JSON schema.
 
-    The validation is rudimentary: it checks that all required keys listed in
-    the schema are present in the plan.  It does not perform type
-    validation or nested checks.  Future versions should integrate a JSON
-    Schema validator for full compliance.
+    With `jsonschema` installed the plan is fully validated (types, nested
+    objects, enums) by a validator compiled once per schema.  Without it
+    the check is rudimentary: all required keys listed in the schema must be
+    present in the plan.
+
+    Raises
+    ------
+    ValueError
+        If the plan does not conform to the schema.
     """
+    if jsonschema is not None:
+        error = jsonschema.exceptions.best_match(_validator(schema).iter_errors(plan))
+        if error is not None:
+            where = "/".join(str(p) for p in error.absolute_path) or "<root>"
+            raise ValueError(f"Plan invalid at {where}: {error.message}") from error
+        return
     required = schema.get("required", [])
     missing = [key for key in required if key not in plan]
     if missing:
@@ -102,5 +208,7 @@ def validate_plan(plan: Dict[str, Any], schema: Dict[str, Any]) -> None:
 
 def load_plan(path: Path) -> Dict[str, Any]:
     """Load a plan JSON file from disk."""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
\ No newline at end of file